@@ -1,15 +1,80 @@
 import oracledb
-import pandas as pd
 import os
-import ast
+
+from scripts.preprocessing import iter_review_frames, normalize_listcol
+
+# Rows sent to Oracle per executemany() round-trip
+BATCH_SIZE = 100
+
+# Statements kept in the connection's statement cache
+STMT_CACHE_SIZE = 40
+
+INSERT_REVIEW_SQL = """
+    INSERT INTO reviews (
+        bank_id, review_text, rating, review_date,
+        source, sentiment_label, sentiment_score, keywords, themes
+    ) VALUES (
+        :1, :2, :3, :4,
+        :5, :6, :7, :8, :9
+    )
+"""
+
+def _insert_review_rows(cursor, df, bank_id, file):
+    """
+    Inserts one chunk of reviews for a bank in executemany() batches.
+
+    Returns:
+        int: Number of rows Oracle rejected.
+    """
+    # Flatten keyword/theme lists into comma-separated text
+    df['keywords'] = normalize_listcol(df['keywords'])
+    df['themes'] = normalize_listcol(df['themes'])
+
+    # Build the bind rows column-wise; tolist() hands oracledb native Python types
+    rows = list(zip(
+        [bank_id] * len(df),
+        df['review_text'].astype(str).tolist(),
+        df['rating'].astype(int).tolist(),
+        df['date'].tolist(),
+        df['source'].astype(str).tolist(),
+        df['sentiment_label'].astype(str).tolist(),
+        df['sentiment_score'].astype(float).tolist(),
+        df['keywords'].tolist(),
+        df['themes'].tolist()
+    ))
+
+    # Declare scalar bind types up front so long texts are not promoted to CLOB binds
+    cursor.setinputsizes(
+        None, oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_NUMBER, oracledb.DB_TYPE_DATE,
+        oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_NUMBER,
+        oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_VARCHAR
+    )
+
+    failed = 0
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(INSERT_REVIEW_SQL, rows[start:start + BATCH_SIZE], batcherrors=True)
+
+        for error in cursor.getbatcherrors():
+            # Log the error and row data for debugging
+            row = df.iloc[start + error.offset]
+            print(f"Error inserting row {row.name} in file {file}: {error.message}")
+            print(f"Row data: {row.to_dict()}")
+            failed += 1
+
+    return failed
 
 def insert_reviews_into_oracle(user, password, dsn, input_dir="../data"):
     """
     Connects to Oracle DB and inserts bank and review data from CSVs.
+
+    Everything is loaded in one transaction with a single commit, so a failed
+    load is rolled back completely.
     """
     try:
         # Connect to Oracle DB
         conn = oracledb.connect(user=user, password=password, dsn=dsn, mode=oracledb.SYSDBA)
+        conn.autocommit = False
+        conn.stmtcachesize = STMT_CACHE_SIZE
         cursor = conn.cursor()
 
         # Load each bank's processed file
@@ -18,88 +83,34 @@ def insert_reviews_into_oracle(user, password, dsn, input_dir="../data"):
         bank_name_to_id = {}
 
         for file in files:
-            df = pd.read_csv(os.path.join(input_dir, file))
-            bank_name = df['bank_name'].iloc[0]
-
-            # Insert bank if not already added
-            if bank_name not in bank_name_to_id:
-                bank_id_var = cursor.var(oracledb.NUMBER)
-                cursor.execute("""
-                    INSERT INTO banks (bank_name)
-                    VALUES (:1)
-                    RETURNING bank_id INTO :2
-                """, (bank_name, bank_id_var))
-                bank_id = bank_id_var.getvalue()[0]  # Extract the scalar value
-                bank_name_to_id[bank_name] = bank_id
-
-            bank_id = bank_name_to_id[bank_name]
-
-            for idx, row in df.iterrows():
-                try:
-                    # Handle keywords
-                    keywords = row['keywords']
-                    if pd.isna(keywords):
-                        keywords = ""
-                    elif isinstance(keywords, str):
-                        try:
-                            # Try to parse as a stringified list
-                            keywords_list = ast.literal_eval(keywords)
-                            if isinstance(keywords_list, (list, tuple)):
-                                keywords = ", ".join(str(k) for k in keywords_list)
-                            else:
-                                keywords = str(keywords_list)
-                        except (ValueError, SyntaxError):
-                            # If parsing fails, treat as a plain string
-                            keywords = keywords
-                    else:
-                        # If not a string, convert to string
-                        keywords = str(keywords)
-
-                    # Handle themes
-                    themes = row['themes']
-                    if pd.isna(themes):
-                        themes = ""
-                    elif isinstance(themes, str):
-                        try:
-                            # Try to parse as a stringified list
-                            themes_list = ast.literal_eval(themes)
-                            if isinstance(themes_list, (list, tuple)):
-                                themes = ", ".join(str(t) for t in themes_list)
-                            else:
-                                themes = str(themes_list)
-                        except (ValueError, SyntaxError):
-                            # If parsing fails, treat as a plain string
-                            themes = themes
-                    else:
-                        # If not a string, convert to string
-                        themes = str(themes)
-
-                    # Execute INSERT statement
+            failed = 0
+            rows_seen = 0
+
+            # Stream the file in chunks so memory stays bounded on large CSVs; dates arrive
+            # as datetime.date so they bind as DATE values, and reruns reuse the Parquet sidecar
+            for df in iter_review_frames(os.path.join(input_dir, file)):
+                if df.empty:
+                    continue
+                df.index += rows_seen  # Keep row numbers file-relative for error reports
+                rows_seen += len(df)
+                bank_name = df['bank_name'].iloc[0]
+
+                # Insert bank if not already added
+                if bank_name not in bank_name_to_id:
+                    bank_id_var = cursor.var(oracledb.NUMBER)
                     cursor.execute("""
-                        INSERT INTO reviews (
-                            bank_id, review_text, rating, review_date,
-                            source, sentiment_label, sentiment_score, keywords, themes
-                        ) VALUES (
-                            :1, :2, :3, TO_DATE(:4, 'YYYY-MM-DD'),
-                            :5, :6, :7, :8, :9
-                        )
-                    """, (
-                        bank_id,
-                        str(row.get('review_text', '')),
-                        int(row.get('rating', 0)),
-                        row.get('date'),
-                        str(row.get('source', 'Google Play')),
-                        str(row.get('sentiment_label', 'neutral')),
-                        float(row.get('sentiment_score', 0.0)),
-                        keywords,
-                        themes
-                    ))
-
-                except Exception as e:
-                    # Log the error and row data for debugging
-                    print(f"Error inserting row {idx} in file {file}: {e}")
-                    print(f"Row data: {row.to_dict()}")
-                    raise  # Re-raise to stop execution and inspect the issue
+                        INSERT INTO banks (bank_name)
+                        VALUES (:1)
+                        RETURNING bank_id INTO :2
+                    """, (bank_name, bank_id_var))
+                    bank_id = bank_id_var.getvalue()[0]  # Extract the scalar value
+                    bank_name_to_id[bank_name] = bank_id
+
+                failed += _insert_review_rows(cursor, df, bank_name_to_id[bank_name], file)
+
+            if failed:
+                # Stop execution so the whole load is rolled back and can be inspected
+                raise RuntimeError(f"{failed} row(s) failed to insert from file {file}")
 
         # Commit the transaction
         conn.commit()
@@ -112,4 +123,4 @@ def insert_reviews_into_oracle(user, password, dsn, input_dir="../data"):
     finally:
         # Clean up
         cursor.close()
-        conn.close()
\ No newline at end of file
+        conn.close()
@@ -1,25 +1,211 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+import ast
+import os
 
-def clean_reviews(review_data: list) -> pd.DataFrame:
+# Bytes of CSV parsed into each Arrow record batch when streaming files
+CSV_BLOCK_SIZE = 4 << 20
+
+# Text columns always read as strings, whatever Arrow would infer from their values
+TEXT_COLUMNS = ["review_text", "date", "bank_name", "source", "sentiment_label", "keywords", "themes"]
+
+# Columns that identify a duplicate review
+DUPLICATE_SUBSET = ["review_text", "rating", "date", "bank_name"]
+
+def hash_rows(df: pd.DataFrame, subset: list = DUPLICATE_SUBSET) -> np.ndarray:
+    """
+    Hash each row's duplicate key to a single 64-bit value.
+
+    Numeric columns are hashed as float64, so a value hashes the same whether
+    its chunk was converted as int64 or (because of a null) as float64.
+
+    Args:
+        df (pd.DataFrame): Reviews.
+        subset (list): Columns forming the duplicate key.
+
+    Returns:
+        np.ndarray: uint64 hash per row.
+    """
+    key = df[subset]
+    numeric = key.select_dtypes("number").columns
+    key = key.astype({col: "float64" for col in numeric})
+    return pd.util.hash_pandas_object(key, index=False).values
+
+def iter_csv_batches(file_path: str, column_types: dict = None) -> pv.CSVStreamingReader:
+    """
+    Stream a review CSV as Arrow record batches using pyarrow's multithreaded parser.
+
+    Empty fields are read as nulls and quoted values may span lines (reviews often
+    contain newlines), matching `pd.read_csv`.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        column_types (dict): Arrow types overriding the defaults for specific columns.
+
+    Returns:
+        pv.CSVStreamingReader: Iterable of `pa.RecordBatch`, with the file's `schema`.
+    """
+    return pv.open_csv(
+        file_path,
+        read_options=pv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+        convert_options=pv.ConvertOptions(
+            column_types={**{col: pa.string() for col in TEXT_COLUMNS}, **(column_types or {})},
+            strings_can_be_null=True
+        )
+    )
+
+# Prefixes of the list/tuple literals written by to_csv for sequence columns
+_SEQUENCE_PREFIXES = ('[', '(')
+
+def _literal_list(text: str) -> list:
+    """Parses a stringified list, falling back to a single-item list if it is malformed."""
+    try:
+        value = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return [text]
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+def _to_list(value) -> list:
+    """Coerces a single list-column value (stringified list, text, sequence or missing) to a list."""
+    if isinstance(value, str):
+        return _literal_list(value) if value.startswith(_SEQUENCE_PREFIXES) else ([value] if value else [])
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return [] if pd.isna(value) else [value]
+
+def _is_text_column(s: pd.Series) -> bool:
+    """True if the column holds only strings (or missing values), i.e. is still unparsed."""
+    return pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+
+def parse_listcol(s: pd.Series) -> pd.Series:
+    """
+    Parse a column of stringified lists (as written by `to_csv`) into Python lists.
+
+    Only list/tuple-shaped strings are run through `ast.literal_eval`; other non-empty
+    values become single-item lists and missing values become empty lists.
+    Columns that already hold sequences (e.g. loaded from a Parquet sidecar)
+    are converted element-wise.
+
+    Args:
+        s (pd.Series): Column of stringified lists.
+
+    Returns:
+        pd.Series: Column of lists.
+    """
+    if not _is_text_column(s):
+        return s.map(_to_list)
+
+    s = s.fillna('').astype(str)
+    mask = s.str.startswith(_SEQUENCE_PREFIXES)
+
+    out = pd.Series([[v] if v else [] for v in s], index=s.index, dtype=object)
+    out[mask.values] = s[mask].map(_literal_list).values
+    return out
+
+def normalize_listcol(s: pd.Series) -> pd.Series:
+    """
+    Flatten a column of stringified lists into comma-separated strings.
+
+    Args:
+        s (pd.Series): Column of stringified lists.
+
+    Returns:
+        pd.Series: Column of strings; missing values become empty strings.
+    """
+    if not _is_text_column(s):
+        return parse_listcol(s).map(lambda xs: ", ".join(map(str, xs)))
+
+    s = s.fillna('').astype(str)
+    mask = s.str.startswith(_SEQUENCE_PREFIXES)
+
+    out = s.copy()
+    out[mask.values] = s[mask].map(lambda t: ", ".join(map(str, _literal_list(t)))).values
+    return out
+
+def iter_review_frames(csv_path: str):
+    """
+    Stream a processed review CSV as DataFrame chunks, cached in a Parquet sidecar.
+
+    Chunks have `keywords`/`themes` parsed into lists and `date` typed as
+    `datetime.date`. The first read writes `<csv_path>.parquet` alongside the
+    CSV; later reads use it for as long as it is not older than the CSV.
+
+    Args:
+        csv_path (str): Path to a `*_with_sentiment_themes.csv` file.
+
+    Yields:
+        pd.DataFrame: Normalized chunk of reviews.
+    """
+    parquet_path = csv_path + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        for batch in pq.ParquetFile(parquet_path).iter_batches():
+            yield batch.to_pandas()
+        return
+
+    # Write to a temporary file so an interrupted read never leaves a partial sidecar
+    tmp_path = parquet_path + ".tmp"
+    writer = None
+    try:
+        for batch in iter_csv_batches(csv_path, {'date': pa.date32()}):
+            table = pa.Table.from_batches([batch])
+            for col in ("keywords", "themes"):
+                parsed = parse_listcol(batch.column(col).to_pandas())
+                index = table.schema.get_field_index(col)
+                table = table.set_column(index, col, pa.array(parsed.tolist(), pa.list_(pa.string())))
+
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+            yield table.to_pandas()
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            os.remove(tmp_path)
+        raise
+
+    if writer is not None:
+        writer.close()
+        os.replace(tmp_path, parquet_path)
+
+def load_reviews(csv_path: str) -> pd.DataFrame:
+    """
+    Load a processed review CSV through its Parquet sidecar (see `iter_review_frames`).
+
+    Args:
+        csv_path (str): Path to a `*_with_sentiment_themes.csv` file.
+
+    Returns:
+        pd.DataFrame: Normalized reviews.
+    """
+    frames = list(iter_review_frames(csv_path))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def clean_reviews(review_data: dict) -> pd.DataFrame:
     """
     Clean and preprocess scraped reviews.
 
     Args:
-        review_data (list): List of review dicts.
+        review_data (dict): Review column lists, as returned by `scrape_reviews`.
 
     Returns:
         pd.DataFrame: Cleaned review DataFrame.
     """
     df = pd.DataFrame(review_data)
 
-    # Drop duplicates
-    df.drop_duplicates(subset=['review_text', 'rating', 'date', 'bank_name'], inplace=True)
+    # Drop duplicates on one hash column instead of comparing the long review text directly
+    df['_h'] = hash_rows(df)
+    df.drop_duplicates(subset=['_h'], inplace=True)
+    df.drop(columns='_h', inplace=True)
 
     # Drop rows with any nulls in key columns
     df.dropna(subset=['review_text', 'rating', 'date'], inplace=True)
 
     # Normalize column types
     df['rating'] = df['rating'].astype(int)
-    df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+    df['date'] = pd.to_datetime(df['date']).dt.date
 
-    return df
\ No newline at end of file
+    return df
@@ -1,7 +1,10 @@
 from google_play_scraper import Sort, reviews
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-def scrape_reviews(app_id: str, bank_name: str, count: int = 500) -> list:
+REVIEW_COLUMNS = ["review_text", "rating", "date", "bank_name", "source"]
+
+def scrape_reviews(app_id: str, bank_name: str, count: int = 500) -> dict:
     """
     Scrape reviews from Google Play for a given app.
     
@@ -11,7 +14,7 @@ def scrape_reviews(app_id: str, bank_name: str, count: int = 500) -> list:
         count (int): Number of reviews to fetch.
     
     Returns:
-        list: List of dicts with keys: review_text, rating, date, bank_name, source.
+        dict: Column lists keyed by review_text, rating, date, bank_name, source.
     """
     logging.info(f"Scraping reviews for {bank_name} ({app_id})")
 
@@ -25,19 +28,39 @@ def scrape_reviews(app_id: str, bank_name: str, count: int = 500) -> list:
             filter_score_with=None
         )
 
-        processed_reviews = []
-        for entry in results:
-            processed_reviews.append({
-                'review_text': entry['content'],
-                'rating': entry['score'],
-                'date': entry['at'].strftime('%Y-%m-%d'),
-                'bank_name': bank_name,
-                'source': 'Google Play'
-            })
-
-        logging.info(f"Retrieved {len(processed_reviews)} reviews from {bank_name}")
+        # Build column lists directly instead of one dict per review
+        processed_reviews = {
+            'review_text': [entry['content'] for entry in results],
+            'rating': [entry['score'] for entry in results],
+            'date': [entry['at'].strftime('%Y-%m-%d') for entry in results],
+            'bank_name': [bank_name] * len(results),
+            'source': ['Google Play'] * len(results)
+        }
+
+        logging.info(f"Retrieved {len(results)} reviews from {bank_name}")
         return processed_reviews
 
     except Exception as e:
         logging.error(f"Error scraping {bank_name}: {e}")
-        return []
\ No newline at end of file
+        return {col: [] for col in REVIEW_COLUMNS}
+
+def scrape_all(apps: dict, count: int = 500) -> dict:
+    """
+    Scrape reviews for several apps concurrently.
+
+    Requests to Google Play are blocking network I/O, so each app is
+    scraped on its own thread.
+
+    Args:
+        apps (dict): Mapping of Google Play app ID to bank name.
+        count (int): Number of reviews to fetch per app.
+
+    Returns:
+        dict: Bank name -> scraped reviews (as returned by scrape_reviews), in input order.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(apps), 1)) as executor:
+        futures = {
+            bank_name: executor.submit(scrape_reviews, app_id, bank_name, count)
+            for app_id, bank_name in apps.items()
+        }
+        return {bank_name: future.result() for bank_name, future in futures.items()}
\ No newline at end of file
@@ -4,97 +4,102 @@ import os
 from datetime import datetime
 import pathlib
 
+# Rows fetched per round-trip when streaming the reviews table
+FETCH_ARRAYSIZE = 5000
+
+# Translation table doubling single quotes for SQL string literals
+_SQL_ESC = str.maketrans({"'": "''"})
+
+def _sql_literal(value):
+    """Render a string as a quoted SQL literal, or NULL if it is None."""
+    return "NULL" if value is None else "'" + value.translate(_SQL_ESC) + "'"
+
 def generate_sql_dump(user, password, dsn, output_file="../SQL dump/database_dump.sql"):
     """
     Generate an SQL dump of the banks and reviews tables.
     """
+    tmp_path = None
     try:
         # Resolve the absolute path for output_file and ensure directory exists
         output_path = pathlib.Path(output_file).resolve()
         output_dir = output_path.parent
         output_dir.mkdir(parents=True, exist_ok=True)  # Create directory if it doesn't exist
+        # Stream into a temp file so a failed run never leaves a truncated dump behind
+        tmp_path = output_path.with_suffix(".sql.tmp")
 
         # Connect to Oracle DB
         conn = oracledb.connect(user=user, password=password, dsn=dsn, mode=oracledb.SYSDBA)
         cursor = conn.cursor()
 
-        # Initialize SQL dump content
-        sql_dump = []
-        sql_dump.append(f"-- SQL Dump of banks and reviews tables")
-        sql_dump.append(f"-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        sql_dump.append("")
+        # Write the dump incrementally so memory stays bounded by the fetch batch size
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("-- SQL Dump of banks and reviews tables\n")
+            f.write(f"-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("\n")
 
-        # Get DDL for tables using DBMS_METADATA
-        tables = ["BANKS", "REVIEWS"]
-        for table in tables:
-            cursor.execute("""
-                SELECT DBMS_METADATA.GET_DDL('TABLE', :table_name)
-                FROM DUAL
-            """, {"table_name": table})
-            ddl = cursor.fetchone()[0].read()  # CLOB to string
-            sql_dump.append(f"-- Table structure for {table.lower()}")
-            sql_dump.append(ddl + ";")
-            sql_dump.append("")
+            # Get DDL for tables using DBMS_METADATA
+            tables = ["BANKS", "REVIEWS"]
+            for table in tables:
+                cursor.execute("""
+                    SELECT DBMS_METADATA.GET_DDL('TABLE', :table_name)
+                    FROM DUAL
+                """, {"table_name": table})
+                ddl = cursor.fetchone()[0].read()  # CLOB to string
+                f.write(f"-- Table structure for {table.lower()}\n")
+                f.write(ddl + ";\n")
+                f.write("\n")
+
+            # Get data from banks table
+            f.write("-- Data for banks\n")
+            cursor.execute("SELECT bank_id, bank_name FROM banks ORDER BY bank_id")
+            rows = cursor.fetchall()
+            for row in rows:
+                bank_id, bank_name = row
+                f.write(
+                    f"INSERT INTO banks (bank_id, bank_name) VALUES ({bank_id}, {_sql_literal(bank_name)});\n"
+                )
+            f.write("\n")
 
-        # Get data from banks table
-        sql_dump.append("-- Data for banks")
-        cursor.execute("SELECT bank_id, bank_name FROM banks ORDER BY bank_id")
-        rows = cursor.fetchall()
-        for row in rows:
-            bank_id, bank_name = row
-            bank_name_escaped = bank_name.replace("'", "''")  # Escape single quotes
-            sql_dump.append(
-                f"INSERT INTO banks (bank_id, bank_name) VALUES ({bank_id}, '{bank_name_escaped}');"
-            )
-        sql_dump.append("")
+            # Get data from reviews table
+            f.write("-- Data for reviews\n")
+            # Fetch reviews in large batches to cut round-trips to the server
+            cursor.arraysize = FETCH_ARRAYSIZE
+            cursor.prefetchrows = FETCH_ARRAYSIZE + 1
+            cursor.execute("""
+                SELECT review_id, bank_id, review_text, rating, review_date,
+                       source, sentiment_label, sentiment_score, keywords, themes
+                FROM reviews
+                ORDER BY review_id
+            """, fetch_lobs=False)  # CLOBs as str, avoiding a round-trip per LOB read
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    review_id, bank_id, review_text, rating, review_date, source, sentiment_label, sentiment_score, keywords, themes = row
+                    rating_val = "NULL" if rating is None else rating
+                    sentiment_score_val = "NULL" if sentiment_score is None else sentiment_score
+                    review_date_val = f"TO_DATE('{review_date.strftime('%Y-%m-%d')}', 'YYYY-MM-DD')" if review_date else "NULL"
 
-        # Get data from reviews table
-        sql_dump.append("-- Data for reviews")
-        cursor.execute("""
-            SELECT review_id, bank_id, review_text, rating, review_date,
-                   source, sentiment_label, sentiment_score, keywords, themes
-            FROM reviews
-            ORDER BY review_id
-        """)
-        rows = cursor.fetchall()
-        for row in rows:
-            review_id, bank_id, review_text, rating, review_date, source, sentiment_label, sentiment_score, keywords, themes = row
-            # Handle LOBs and NULLs with string escaping
-            review_text_str = review_text.read() if isinstance(review_text, oracledb.LOB) else review_text
-            review_text_escaped = "NULL" if review_text_str is None else f"'{review_text_str.replace("'", "''")}'"
-            
-            keywords_str = keywords.read() if isinstance(keywords, oracledb.LOB) else keywords
-            keywords_escaped = "NULL" if keywords_str is None else f"'{keywords_str.replace("'", "''")}'"
-            
-            themes_str = themes.read() if isinstance(themes, oracledb.LOB) else themes
-            themes_escaped = "NULL" if themes_str is None else f"'{themes_str.replace("'", "''")}'"
-            
-            source_escaped = "NULL" if source is None else f"'{source.replace("'", "''")}'"
-            sentiment_label_escaped = "NULL" if sentiment_label is None else f"'{sentiment_label.replace("'", "''")}'"
-            
-            rating_val = "NULL" if rating is None else rating
-            sentiment_score_val = "NULL" if sentiment_score is None else sentiment_score
-            review_date_val = f"TO_DATE('{review_date.strftime('%Y-%m-%d')}', 'YYYY-MM-DD')" if review_date else "NULL"
-            
-            sql_dump.append(
-                f"INSERT INTO reviews (review_id, bank_id, review_text, rating, review_date, "
-                f"source, sentiment_label, sentiment_score, keywords, themes) "
-                f"VALUES ({review_id}, {bank_id}, {review_text_escaped}, {rating_val}, {review_date_val}, "
-                f"{source_escaped}, {sentiment_label_escaped}, {sentiment_score_val}, {keywords_escaped}, {themes_escaped});"
-            )
-        sql_dump.append("")
+                    f.write(
+                        f"INSERT INTO reviews (review_id, bank_id, review_text, rating, review_date, "
+                        f"source, sentiment_label, sentiment_score, keywords, themes) "
+                        f"VALUES ({review_id}, {bank_id}, {_sql_literal(review_text)}, {rating_val}, {review_date_val}, "
+                        f"{_sql_literal(source)}, {_sql_literal(sentiment_label)}, {sentiment_score_val}, "
+                        f"{_sql_literal(keywords)}, {_sql_literal(themes)});\n"
+                    )
+            f.write("\n")
 
-        # Add COMMIT statement
-        sql_dump.append("COMMIT;")
+            # Add COMMIT statement
+            f.write("COMMIT;\n")
+        os.replace(tmp_path, output_path)
 
-        # Write to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(sql_dump))
-        
         print(f"\u2705 SQL dump written to {output_file}")
 
     except Exception as e:
         print(f"Error generating SQL dump: {e}")
+        if tmp_path is not None and tmp_path.exists():
+            os.remove(tmp_path)
         raise
     finally:
         cursor.close()
@@ -1,39 +1,105 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
-from collections import defaultdict
+from functools import lru_cache
+import ahocorasick
 import pandas as pd
+import numpy as np
 import spacy 
 import logging
+import os
 
 logging.basicConfig(level=logging.INFO)
 
 # Load spaCy model once
 nlp = spacy.load("en_core_web_sm")
 
+# TF-IDF rows densified at a time when picking top keywords
+KEYWORD_BLOCK_ROWS = 4096
+
+def preprocess_texts(texts, batch_size=256, n_process=max(1, (os.cpu_count() or 1) // 2)):
+    """Tokenizes, removes stopwords, lemmatizes a batch of texts using spaCy's nlp.pipe."""
+    docs = nlp.pipe(
+        (text.lower() for text in texts),
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=["parser", "ner"]
+    )
+    return [" ".join(token.lemma_ for token in doc if not token.is_stop and token.is_alpha) for doc in docs]
+
 def preprocess_text(text):
     """Tokenizes, removes stopwords, lemmatizes using spaCy."""
-    doc = nlp(text.lower())
-    tokens = [token.lemma_ for token in doc if not token.is_stop and token.is_alpha]
-    return " ".join(tokens)
+    return preprocess_texts([text], n_process=1)[0]
+
+def get_top_keywords(tfidf_matrix, feature_names, top_n):
+    """
+    Returns the top_n non-zero features of every row, highest score first.
 
-def get_top_keywords(row_vector, feature_names, top_n):
-    row_array = row_vector.toarray().flatten()
-    top_indices = row_array.argsort()[-top_n:][::-1]
-    return [feature_names[i] for i in top_indices if row_array[i] > 0]
+    Tied scores are ranked by higher feature index. This is a defined rule of its own:
+    the per-row argsort()[::-1] it replaces left the order of ties unspecified.
+    """
+    dense = tfidf_matrix.toarray()
+    n_rows, n_features = dense.shape
+    k = min(top_n, n_features)
+    if k <= 0:
+        return [[] for _ in range(n_rows)]
+    # Widen the top-k candidates to every non-zero score tied with the k-th best,
+    # so ties at the cut-off are ranked by the rule rather than by argpartition
+    kth = -np.partition(-dense, k - 1, axis=1)[:, k - 1]
+    width = int(((dense >= kth[:, None]) & (dense > 0)).sum(axis=1).max(initial=0))
+    if width == 0:
+        return [[] for _ in range(n_rows)]
+    candidates = np.argpartition(-dense, width - 1, axis=1)[:, :width]
+    scores = np.take_along_axis(dense, candidates, axis=1)
+    order = np.lexsort((-candidates, -scores), axis=1)[:, :k]
+    top_indices = np.take_along_axis(candidates, order, axis=1)
+    top_scores = np.take_along_axis(scores, order, axis=1)
+    names = feature_names[top_indices]
+    return [list(row[mask]) for row, mask in zip(names, top_scores > 0)]
 
 def extract_keywords(df: pd.DataFrame, text_column: str, top_n: int = 5) -> pd.DataFrame:
     vectorizer = TfidfVectorizer(max_features=1000, ngram_range=(1, 2))
     tfidf_matrix = vectorizer.fit_transform(df[text_column])
     feature_names = vectorizer.get_feature_names_out()
-    df['keywords'] = [get_top_keywords(tfidf_matrix[i], feature_names, top_n) for i in range(tfidf_matrix.shape[0])]
+    # Densify in row blocks to keep memory bounded on large frames
+    keywords = []
+    for start in range(0, tfidf_matrix.shape[0], KEYWORD_BLOCK_ROWS):
+        block = tfidf_matrix[start:start + KEYWORD_BLOCK_ROWS]
+        keywords.extend(get_top_keywords(block, feature_names, top_n))
+    df['keywords'] = keywords
     logging.info("Extracted keywords using TF-IDF.")
     return df
 
+@lru_cache(maxsize=8)
+def _build_theme_automaton(theme_items: tuple) -> tuple:
+    """
+    Builds an Aho-Corasick automaton matching every non-empty theme key at once.
+
+    Returns (automaton, empty_key_themes): an empty key is a substring of every keyword,
+    so its theme is kept aside and added whenever there is at least one keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    empty_key_themes = []
+    for key, theme in theme_items:
+        if key:
+            automaton.add_word(key, theme)
+        else:
+            empty_key_themes.append(theme)
+    if len(automaton):
+        automaton.make_automaton()
+    return automaton, empty_key_themes
+
+def _theme_automaton(theme_map: dict) -> tuple:
+    theme_items = tuple(theme_map.items())
+    try:
+        return _build_theme_automaton(theme_items)
+    except TypeError:
+        # Unhashable theme values cannot be cached; build the automaton for this call only
+        return _build_theme_automaton.__wrapped__(theme_items)
+
 def map_keywords_to_themes(keywords: list, theme_map: dict) -> list:
-    themes = set()
-    for kw in keywords:
-        for key, theme in theme_map.items():
-            if key in kw:
-                themes.add(theme)
+    automaton, empty_key_themes = _theme_automaton(theme_map)
+    themes = set(empty_key_themes) if len(keywords) else set()
+    if automaton.kind == ahocorasick.AHOCORASICK:
+        themes.update(theme for kw in keywords for _, theme in automaton.iter(kw))
     return list(themes) if themes else ["Other"]
 
 def aggregate_sentiment_by_rating(df: pd.DataFrame, bank_name: str) -> pd.DataFrame:
@@ -42,9 +108,6 @@ def aggregate_sentiment_by_rating(df: pd.DataFrame, bank_name: str) -> pd.DataFr
     return agg
 
 def get_examples_by_theme(df, theme_col='themes', text_col='review_text', max_examples=3):
-    theme_examples = defaultdict(list)
-    for _, row in df.iterrows():
-        for theme in row[theme_col]:
-            if len(theme_examples[theme]) < max_examples:
-                theme_examples[theme].append(row[text_col])
-    return theme_examples
\ No newline at end of file
+    exploded = df[[theme_col, text_col]].explode(theme_col).dropna(subset=[theme_col])
+    picked = exploded.groupby(theme_col, sort=False).head(max_examples)
+    return picked.groupby(theme_col, sort=False)[text_col].agg(list).to_dict()
\ No newline at end of file
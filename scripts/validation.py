@@ -1,5 +1,9 @@
 import os
 import pandas as pd
+import numpy as np
+import pyarrow.compute as pc
+
+from scripts.preprocessing import DUPLICATE_SUBSET, hash_rows, iter_csv_batches
 
 # Constants
 EXPECTED_FILES = {
@@ -10,16 +14,32 @@ EXPECTED_FILES = {
 
 REQUIRED_COLUMNS = ["review_text", "rating", "date", "bank_name", "source"]
 
-def load_and_validate_reviews(data_dir):
+def _dates_well_formed(dates):
+    """Checks a string column is YYYY-MM-DD shaped via its length and dash positions (nulls are skipped)."""
+    well_formed = pc.and_(
+        pc.equal(pc.binary_length(dates), 10),
+        pc.and_(
+            pc.equal(pc.utf8_slice_codeunits(dates, 4, 5), "-"),
+            pc.equal(pc.utf8_slice_codeunits(dates, 7, 8), "-")
+        )
+    )
+    return pc.all(well_formed, min_count=0).as_py()
+
+def load_and_validate_reviews(data_dir, return_combined=True):
     """
     Loads and validates bank review data from specific CSV files.
+
+    Files are streamed as Arrow record batches and validation metrics are
+    computed on the batches directly, so memory stays bounded and no pandas
+    DataFrame is built unless the combined DataFrame is requested.
     
     Args:
         data_dir (str): Path to directory containing bank review CSVs
+        return_combined (bool): Whether to keep and return all reviews as one DataFrame
         
     Returns:
         dict: {
-            'combined_df': Combined DataFrame of all reviews,
+            'combined_df': Combined DataFrame of all reviews (None if return_combined is False),
             'summary_df': DataFrame with per-file stats,
             'missing_files': List of missing expected files,
             'metrics': Dictionary of overall metrics
@@ -36,24 +56,34 @@ def load_and_validate_reviews(data_dir):
         if not os.path.exists(file_path):
             missing_files.append(expected_fname)
             continue
-            
-        df = pd.read_csv(file_path)
-        
+
+        total = 0
+        missing = 0
+        date_format_ok = True
+        row_hashes = []
+
+        reader = iter_csv_batches(file_path)
+
         # Validate columns
-        missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+        missing_cols = [col for col in REQUIRED_COLUMNS if col not in reader.schema.names]
         if missing_cols:
             raise ValueError(f"Missing columns in {expected_fname}: {', '.join(missing_cols)}")
-        
-        # Calculate metrics
-        total = len(df)
-        missing = df[REQUIRED_COLUMNS].isnull().sum().sum()
-        missing_pct = (missing / (total * len(REQUIRED_COLUMNS))) * 100
-        
-        duplicates = df.duplicated(subset=["review_text", "rating", "date", "bank_name"]).sum()
-        date_format_ok = df["date"].str.match(r"\d{4}-\d{2}-\d{2}").all()
-        
-        all_data.append(df)
-        
+
+        for batch in reader:
+            # Accumulate metrics
+            total += batch.num_rows
+            missing += sum(batch.column(col).null_count for col in REQUIRED_COLUMNS)
+            date_format_ok = date_format_ok and _dates_well_formed(batch.column("date"))
+
+            # Hash the duplicate key so duplicates spanning batches are still caught
+            row_hashes.append(hash_rows(batch.select(DUPLICATE_SUBSET).to_pandas()))
+
+            if return_combined:
+                all_data.append(batch.to_pandas())
+
+        missing_pct = (missing / (total * len(REQUIRED_COLUMNS))) * 100 if total else 0.0
+        duplicates = total - len(np.unique(np.concatenate(row_hashes))) if row_hashes else 0
+
         summary.append({
             "bank": bank_name.replace("_", " ").title(),
             "file": expected_fname,
@@ -65,14 +95,16 @@ def load_and_validate_reviews(data_dir):
         })
 
     # Combine all data
-    combined = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+    combined = None
+    if return_combined:
+        combined = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     summary_df = pd.DataFrame(summary)
     
-    # Calculate overall metrics
+    # Calculate overall metrics from the per-file counters
     metrics = {}
-    if not combined.empty:
-        total_reviews = len(combined)
-        overall_missing = combined[REQUIRED_COLUMNS].isnull().sum().sum()
+    if not summary_df.empty and summary_df["reviews"].sum() > 0:
+        total_reviews = summary_df["reviews"].sum()
+        overall_missing = summary_df["missing_values"].sum()
         overall_pct = (overall_missing / (total_reviews * len(REQUIRED_COLUMNS))) * 100
         total_duplicates = summary_df["duplicates"].sum()
         
@@ -2,7 +2,9 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 import pandas as pd
-import ast
+from collections import Counter
+
+from scripts.preprocessing import parse_listcol
 
 sns.set(style="whitegrid")
 
@@ -26,14 +28,27 @@ def plot_rating_distribution(df):
     plt.tight_layout()
     plt.show()
 
-def plot_theme_counts(df):
-    df['themes'] = df['themes'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
-    exploded = df.explode('themes')
-    exploded = exploded[exploded['themes'] != 'Other']
+def theme_counts(df):
+    """Counts theme mentions per bank (excluding 'Other') in one pass over the theme lists."""
+    counter = Counter()
+    for bank, themes in zip(df['bank'].values, parse_listcol(df['themes']).values):
+        for theme in themes:
+            if theme != 'Other':
+                counter[(bank, theme)] += 1
+
+    counts = pd.DataFrame(
+        [(bank, theme, n) for (bank, theme), n in counter.items()],
+        columns=['bank', 'themes', 'count']
+    )
+    return counts.sort_values(['bank', 'themes'], ignore_index=True)
 
+def plot_theme_counts(df, counts=None):
+    """Plots theme mentions per bank; pass counts from theme_counts(df) to reuse them."""
+    if counts is None:
+        counts = theme_counts(df)
     plt.figure(figsize=(12, 6))
     sns.barplot(
-        data=exploded.groupby(['bank', 'themes']).size().reset_index(name='count'),
+        data=counts,
         x='themes', y='count', hue='bank'
     )
     plt.title("Theme Mentions per Bank (Excluding 'Other')")
@@ -45,11 +60,11 @@ def plot_theme_counts(df):
     plt.show()
 
 def generate_wordcloud(df, column="keywords", title="Word Cloud"):
-    text = " ".join(
-        kw for kw_list in df[column].dropna()
-        for kw in (ast.literal_eval(kw_list) if isinstance(kw_list, str) and kw_list.startswith("[") else [])
-    )
-    wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
+    # Count keywords directly rather than joining them into one string for WordCloud to re-tokenize
+    freqs = Counter()
+    for kw_list in parse_listcol(df[column]):
+        freqs.update(kw_list)
+    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(freqs)
 
     plt.figure(figsize=(10, 5))
     plt.imshow(wordcloud, interpolation='bilinear')
@@ -58,19 +73,12 @@ def generate_wordcloud(df, column="keywords", title="Word Cloud"):
     plt.tight_layout()
     plt.show()
 
-def theme_counts_table(df):
-    df['themes'] = df['themes'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
-    exploded = df.explode('themes')
-    exploded = exploded[exploded['themes'] != 'Other']
-
-    theme_counts = (
-        exploded.groupby(['bank', 'themes'])
-        .size()
-        .reset_index(name='count')
-    )
-
+def theme_counts_table(df, counts=None):
+    """Pivots theme mentions per bank into a styled table; counts is reused as in plot_theme_counts."""
+    if counts is None:
+        counts = theme_counts(df)
     pivot_table = pd.pivot_table(
-        theme_counts,
+        counts,
         values='count',
         index='themes',
         columns='bank',
@@ -0,0 +1,144 @@
+import ast
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+import scripts.preprocessing as preprocessing
+
+
+def _write_multiline_reviews(path, n=50):
+    df = pd.DataFrame({
+        "review_text": [f"line one {i}\nline two, \"quoted\"" for i in range(n)],
+        "rating": 5,
+        "date": "2024-01-02",
+        "bank_name": "Dashen Bank",
+        "source": "Google Play",
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_iter_csv_batches_reads_multiline_values_across_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 256)
+    path = tmp_path / "reviews.csv"
+    expected = _write_multiline_reviews(path)
+
+    batches = list(preprocessing.iter_csv_batches(str(path)))
+
+    assert len(batches) > 1
+    texts = [text for batch in batches for text in batch.column("review_text").to_pylist()]
+    assert texts == expected["review_text"].tolist()
+
+
+def _old_list_to_text(value):
+    """Per-row keywords/themes flattening that insert_reviews_into_oracle used before vectorizing."""
+    if pd.isna(value):
+        return ""
+    if not isinstance(value, str):
+        return str(value)
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+    if isinstance(parsed, (list, tuple)):
+        return ", ".join(str(v) for v in parsed)
+    return str(parsed)
+
+
+LIST_VALUES = ["['app', 'slow']", "[]", "['Other']", "plain text", "[broken", "('a', 'b')", None, np.nan]
+
+
+def test_normalize_listcol_matches_per_row_literal_eval():
+    s = pd.Series(LIST_VALUES, dtype=object)
+
+    assert preprocessing.normalize_listcol(s).tolist() == [_old_list_to_text(v) for v in s]
+
+
+def test_parse_listcol_parses_stringified_lists():
+    s = pd.Series(LIST_VALUES, dtype=object)
+
+    assert preprocessing.parse_listcol(s).tolist() == [
+        ["app", "slow"], [], ["Other"], ["plain text"], ["[broken"], ["a", "b"], [], []
+    ]
+
+
+def test_listcol_helpers_accept_parsed_sequences():
+    s = pd.Series([["app", "slow"], np.array(["Other"], dtype=object), [], None], dtype=object)
+
+    assert preprocessing.parse_listcol(s).tolist() == [["app", "slow"], ["Other"], [], []]
+    assert preprocessing.normalize_listcol(s).tolist() == ["app, slow", "Other", "", ""]
+
+
+def _write_processed_reviews(path, n=40, keyword="slow"):
+    df = pd.DataFrame({
+        "review_text": [f"review {i}" for i in range(n)],
+        "rating": 4,
+        "date": "2024-01-02",
+        "bank_name": "Dashen Bank",
+        "source": "Google Play",
+        "sentiment_label": "negative",
+        "sentiment_score": -0.5,
+        "keywords": [str(["app", keyword])] * n,
+        "themes": [str(["Performance"])] * n,
+    })
+    df.to_csv(path, index=False)
+
+
+def test_iter_review_frames_writes_normalized_sidecar(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 512)
+    csv_path = tmp_path / "dashen_bank_reviews_with_sentiment_themes.csv"
+    _write_processed_reviews(csv_path)
+
+    frames = list(preprocessing.iter_review_frames(str(csv_path)))
+
+    assert len(frames) > 1
+    df = pd.concat(frames, ignore_index=True)
+    assert len(df) == 40
+    assert list(df.loc[0, "keywords"]) == ["app", "slow"]
+    assert list(df.loc[0, "themes"]) == ["Performance"]
+    assert df.loc[0, "date"] == datetime.date(2024, 1, 2)
+    assert (tmp_path / (csv_path.name + ".parquet")).exists()
+    assert not (tmp_path / (csv_path.name + ".parquet.tmp")).exists()
+
+
+def test_load_reviews_reuses_fresh_sidecar(tmp_path, monkeypatch):
+    csv_path = tmp_path / "reviews_with_sentiment_themes.csv"
+    _write_processed_reviews(csv_path)
+    preprocessing.load_reviews(str(csv_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV should not be re-parsed while the sidecar is fresh")
+
+    monkeypatch.setattr(preprocessing, "iter_csv_batches", fail)
+    df = preprocessing.load_reviews(str(csv_path))
+
+    assert len(df) == 40
+    assert list(df.loc[0, "keywords"]) == ["app", "slow"]
+
+
+def test_load_reviews_rebuilds_sidecar_when_csv_is_newer(tmp_path):
+    csv_path = tmp_path / "reviews_with_sentiment_themes.csv"
+    _write_processed_reviews(csv_path)
+    preprocessing.load_reviews(str(csv_path))
+
+    _write_processed_reviews(csv_path, n=10, keyword="crash")
+    sidecar_mtime = os.path.getmtime(str(csv_path) + ".parquet")
+    os.utime(csv_path, (sidecar_mtime + 10, sidecar_mtime + 10))
+    df = preprocessing.load_reviews(str(csv_path))
+
+    assert len(df) == 10
+    assert list(df.loc[0, "keywords"]) == ["app", "crash"]
+
+
+def test_iter_review_frames_leaves_no_partial_sidecar(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 512)
+    csv_path = tmp_path / "reviews_with_sentiment_themes.csv"
+    _write_processed_reviews(csv_path)
+
+    frames = preprocessing.iter_review_frames(str(csv_path))
+    next(frames)
+    frames.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [csv_path.name]
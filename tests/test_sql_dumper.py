@@ -0,0 +1,19 @@
+from scripts.sql_dumper import _sql_literal
+
+
+def test_sql_literal_quotes_plain_strings():
+    assert _sql_literal("Dashen Bank") == "'Dashen Bank'"
+
+
+def test_sql_literal_doubles_single_quotes():
+    assert _sql_literal("it's the 'best' app") == "'it''s the ''best'' app'"
+    assert _sql_literal("'") == "''''"
+
+
+def test_sql_literal_renders_none_as_null():
+    assert _sql_literal(None) == "NULL"
+
+
+def test_sql_literal_keeps_empty_strings_and_newlines():
+    assert _sql_literal("") == "''"
+    assert _sql_literal("line one\nline two") == "'line one\nline two'"
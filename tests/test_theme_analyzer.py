@@ -0,0 +1,107 @@
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+from scripts.theme_analyzer import get_examples_by_theme, get_top_keywords, map_keywords_to_themes
+
+
+FEATURES = np.array(["alpha", "beta", "gamma", "delta", "epsilon"], dtype=object)
+
+
+def test_get_top_keywords_orders_by_score_and_skips_zeros():
+    matrix = csr_matrix([[0.1, 0.0, 0.7, 0.3, 0.0]])
+
+    assert get_top_keywords(matrix, FEATURES, 5) == [["gamma", "delta", "alpha"]]
+
+
+def test_get_top_keywords_breaks_ties_by_higher_feature_index():
+    matrix = csr_matrix([
+        [0.5, 0.5, 0.5, 0.5, 0.0],
+        [0.2, 0.9, 0.2, 0.0, 0.2],
+    ])
+
+    assert get_top_keywords(matrix, FEATURES, 2) == [["delta", "gamma"], ["beta", "epsilon"]]
+
+
+def test_get_top_keywords_matches_reference_ranking():
+    rng = np.random.default_rng(0)
+    # Few distinct scores over a wide vocabulary, so most rows tie at the cut-off
+    dense = rng.integers(0, 4, size=(50, 1000)) / 3 * (rng.random((50, 1000)) < 0.05)
+    features = np.array([f"f{i}" for i in range(1000)], dtype=object)
+
+    expected = []
+    for row in dense:
+        ranked = sorted(range(len(row)), key=lambda i: (-row[i], -i))[:5]
+        expected.append([features[i] for i in ranked if row[i] > 0])
+
+    assert get_top_keywords(csr_matrix(dense), features, 5) == expected
+
+
+def test_get_top_keywords_handles_empty_rows_and_large_top_n():
+    matrix = csr_matrix([[0.0] * 5, [0.0, 0.4, 0.0, 0.0, 0.0]])
+
+    assert get_top_keywords(matrix, FEATURES, 10) == [[], ["beta"]]
+
+
+THEME_MAP = {
+    "login": "Account Access",
+    "password": "Account Access",
+    "slow": "Performance",
+    "crash": "Performance",
+    "transfer": "Transactions",
+}
+
+
+def test_map_keywords_to_themes_matches_substrings():
+    themes = map_keywords_to_themes(["cannot login", "app slow crash", "nice"], THEME_MAP)
+
+    assert sorted(themes) == ["Account Access", "Performance"]
+
+
+def test_map_keywords_to_themes_matches_overlapping_keys():
+    themes = map_keywords_to_themes(["relogin"], {"login": "Account Access", "log": "Logs"})
+
+    assert sorted(themes) == ["Account Access", "Logs"]
+
+
+def test_map_keywords_to_themes_defaults_to_other():
+    assert map_keywords_to_themes(["great app"], THEME_MAP) == ["Other"]
+    assert map_keywords_to_themes([], THEME_MAP) == ["Other"]
+
+
+def test_map_keywords_to_themes_handles_empty_maps_and_keys():
+    assert map_keywords_to_themes(["login"], {}) == ["Other"]
+    # An empty key is a substring of every keyword, as with the old `key in kw` scan
+    assert map_keywords_to_themes(["login"], {"": "Everything"}) == ["Everything"]
+    assert map_keywords_to_themes([], {"": "Everything"}) == ["Other"]
+    themes = map_keywords_to_themes(["login"], {"": "Everything", "login": "Account Access"})
+    assert sorted(themes) == ["Account Access", "Everything"]
+
+
+def test_map_keywords_to_themes_accepts_unhashable_theme_values():
+    assert map_keywords_to_themes(["other"], {"login": ["Account Access"]}) == ["Other"]
+
+
+def _old_examples_by_theme(df, theme_col='themes', text_col='review_text', max_examples=3):
+    """Row-by-row get_examples_by_theme from before the explode/groupby rewrite."""
+    theme_examples = defaultdict(list)
+    for _, row in df.iterrows():
+        for theme in row[theme_col]:
+            if len(theme_examples[theme]) < max_examples:
+                theme_examples[theme].append(row[text_col])
+    return theme_examples
+
+
+def test_get_examples_by_theme_matches_iterrows_version():
+    rng = np.random.default_rng(0)
+    pool = ["Account Access", "Performance", "Transactions", "UI", "Other"]
+    themes = [list(rng.choice(pool, size=rng.integers(0, 4), replace=False)) for _ in range(40)]
+    df = pd.DataFrame({"themes": themes, "review_text": [f"review {i}" for i in range(40)]})
+
+    for max_examples in (1, 3, 10):
+        expected = _old_examples_by_theme(df, max_examples=max_examples)
+        result = get_examples_by_theme(df, max_examples=max_examples)
+        assert result == dict(expected)
+        assert list(result) == list(expected)
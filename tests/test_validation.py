@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+import scripts.preprocessing as preprocessing
+from scripts.validation import load_and_validate_reviews
+
+
+def _write_lines(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_duplicates_spanning_int_and_float_batches_are_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 128)
+    # The first batch holds a null rating (converted as float64); the last one does not (int64)
+    lines = ["review_text,rating,date,bank_name,source",
+             "no rating,,2024-01-02,Dashen Bank,Google Play",
+             "dup,5,2024-01-02,Dashen Bank,Google Play"]
+    lines += [f"filler {i},4,2024-01-02,Dashen Bank,Google Play" for i in range(20)]
+    lines += ["dup,5,2024-01-02,Dashen Bank,Google Play"]
+    path = tmp_path / "dashen_bank_reviews.csv"
+    _write_lines(path, lines)
+    assert len(list(preprocessing.iter_csv_batches(str(path)))) > 1
+
+    summary = load_and_validate_reviews(str(tmp_path))["summary_df"].iloc[0]
+
+    expected = pd.read_csv(path).duplicated(subset=preprocessing.DUPLICATE_SUBSET).sum()
+    assert summary["duplicates"] == expected == 1
+
+
+def _review_lines(n, date="2024-01-02", text="review"):
+    return [f"{text} {i},{i % 5 + 1},{date},Dashen Bank,Google Play" for i in range(n)]
+
+
+def test_metrics_accumulate_across_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 256)
+    header = "review_text,rating,date,bank_name,source"
+    # Missing values in the first and last rows, so they land in different batches
+    lines = [header, ",3,2024-01-02,Dashen Bank,Google Play"] + _review_lines(30)
+    lines += ["late review,4,2024-01-03,Dashen Bank,"]
+    path = tmp_path / "dashen_bank_reviews.csv"
+    _write_lines(path, lines)
+    _write_lines(tmp_path / "bank_of_abyssinia_reviews.csv", [header] + _review_lines(10, text="boa"))
+    assert len(list(preprocessing.iter_csv_batches(str(path)))) > 1
+
+    results = load_and_validate_reviews(str(tmp_path))
+
+    summary = results["summary_df"].set_index("file")
+    dashen = summary.loc["dashen_bank_reviews.csv"]
+    assert dashen["reviews"] == 32
+    assert dashen["missing_values"] == 2
+    assert dashen["missing_%"] == round(2 / (32 * 5) * 100, 2)
+    assert dashen["duplicates"] == 0
+    assert bool(dashen["date_format_OK"])
+    assert results["missing_files"] == ["commercial_bank_of_ethiopia_reviews.csv"]
+    assert results["metrics"] == {
+        "total_reviews": 42,
+        "overall_missing_pct": round(2 / (42 * 5) * 100, 2),
+        "total_duplicates": 0,
+        "all_files_present": False,
+    }
+    assert len(results["combined_df"]) == 42
+
+
+def test_bad_date_in_later_batch_fails_format_check(tmp_path, monkeypatch):
+    monkeypatch.setattr(preprocessing, "CSV_BLOCK_SIZE", 256)
+    lines = ["review_text,rating,date,bank_name,source"] + _review_lines(30)
+    lines += _review_lines(1, date="02/01/2024", text="late")
+    path = tmp_path / "dashen_bank_reviews.csv"
+    _write_lines(path, lines)
+    assert len(list(preprocessing.iter_csv_batches(str(path)))) > 1
+
+    summary = load_and_validate_reviews(str(tmp_path))["summary_df"].iloc[0]
+
+    assert not summary["date_format_OK"]
+
+
+def test_combined_df_is_optional(tmp_path):
+    _write_lines(tmp_path / "dashen_bank_reviews.csv",
+                 ["review_text,rating,date,bank_name,source"] + _review_lines(3))
+
+    results = load_and_validate_reviews(str(tmp_path), return_combined=False)
+
+    assert results["combined_df"] is None
+    assert results["metrics"]["total_reviews"] == 3
+
+
+def test_missing_required_column_raises(tmp_path):
+    _write_lines(tmp_path / "dashen_bank_reviews.csv", ["review_text,rating,date,bank_name", "a,5,2024-01-02,B"])
+
+    with pytest.raises(ValueError, match="source"):
+        load_and_validate_reviews(str(tmp_path))
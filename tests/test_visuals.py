@@ -0,0 +1,54 @@
+import ast
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pandas as pd
+import pandas.testing as tm
+
+from scripts.visuals import theme_counts, theme_counts_table
+
+
+def _old_theme_counts(df):
+    """explode/groupby aggregation plot_theme_counts and theme_counts_table used before theme_counts."""
+    df = df.copy()
+    df['themes'] = df['themes'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+    exploded = df.explode('themes')
+    exploded = exploded[exploded['themes'] != 'Other']
+    return exploded.groupby(['bank', 'themes']).size().reset_index(name='count')
+
+
+REVIEWS = pd.DataFrame({
+    "bank": ["Dashen Bank", "BOA", "Dashen Bank", "CBE", "BOA", "Dashen Bank", "CBE"],
+    "themes": [
+        "['Account Access', 'Performance']",
+        "['Other']",
+        ['Performance'],
+        "['Transactions', 'Account Access']",
+        "['Performance', 'Performance']",
+        "[]",
+        ['Other', 'Transactions'],
+    ],
+})
+
+
+def test_theme_counts_matches_explode_groupby():
+    tm.assert_frame_equal(theme_counts(REVIEWS), _old_theme_counts(REVIEWS))
+
+
+def test_theme_counts_does_not_modify_input():
+    df = REVIEWS.copy()
+
+    theme_counts(df)
+
+    tm.assert_frame_equal(df, REVIEWS)
+
+
+def test_theme_counts_table_reuses_precomputed_counts():
+    counts = theme_counts(REVIEWS)
+
+    table = theme_counts_table(REVIEWS.iloc[:0], counts).data
+
+    assert table.loc["Performance", "Total"] == 4
+    assert "Other" not in table.index